@@ -10,8 +10,8 @@ Only stable, high-level entrypoints should be re-exported here.
 
 from .decoder import Decoder
 from .hiscores import Hiscores
-from .client import HiscoresClient
-from .hiscores_api import HiscoresAPI
+from .client import AsyncHiscoresClient, HiscoresClient
+from .hiscores_api import AsyncHiscoresAPI, HiscoresAPI
 from .items import ItemsClient
 
 __all__ = [
@@ -19,5 +19,7 @@ __all__ = [
     "Hiscores",
     "HiscoresClient",
     "HiscoresAPI",
+    "AsyncHiscoresClient",
+    "AsyncHiscoresAPI",
     "ItemsClient",
 ]
@@ -2,19 +2,58 @@
 Low-level HTTP client for the official OSRS hiscores JSON endpoint.
 
 This file intentionally stays tiny: build URL → fetch JSON → raise a clean error.
+`AsyncHiscoresClient` offers the same call over `httpx` for concurrent lookups.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
-import requests
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional speedup
+    orjson = None
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
 
 from .constants import DEFAULT_HISCORES_BASE_URL, DEFAULT_TIMEOUT
 from .exceptions import FetchError
 
 
+def mode_suffix(
+    *,
+    ironman: bool = False,
+    hardcore: bool = False,
+    ultimate: bool = False,
+    deadman: bool = False,
+    seasonal: bool = False,
+) -> str:
+    """
+    Convert mode flags into the hiscores endpoint suffix.
+
+    If multiple modes are passed, the most specific mode wins.
+
+    Returns
+    -------
+    str
+        URL suffix such as "_ironman" or "_hardcore_ironman".
+    """
+    if seasonal:
+        return "_seasonal"
+    if deadman:
+        return "_deadman"
+    if ultimate:
+        return "_ultimate"
+    if hardcore:
+        return "_hardcore_ironman"
+    if ironman:
+        return "_ironman"
+    return ""
+
+
 @dataclass(slots=True)
 class HiscoresClient:
     """
@@ -29,6 +68,10 @@ class HiscoresClient:
 
     Notes
     -----
+    A `requests.Session` is created lazily on the first fetch and reused,
+    so repeated lookups share one keep-alive connection pool. Call
+    `close()` to release it.
+
     The OSRS hiscores endpoint uses different URL suffixes for modes.
     If multiple modes are passed, the most specific mode wins.
 
@@ -39,34 +82,38 @@ class HiscoresClient:
     base_url: str = DEFAULT_HISCORES_BASE_URL
     timeout: int = DEFAULT_TIMEOUT
 
-    def _mode_suffix(
-        self,
-        *,
-        ironman: bool = False,
-        hardcore: bool = False,
-        ultimate: bool = False,
-        deadman: bool = False,
-        seasonal: bool = False,
-    ) -> str:
-        """
-        Convert mode flags into the hiscores endpoint suffix.
-
-        Returns
-        -------
-        str
-            URL suffix such as "_ironman" or "_hardcore_ironman".
-        """
-        if seasonal:
-            return "_seasonal"
-        if deadman:
-            return "_deadman"
-        if ultimate:
-            return "_ultimate"
-        if hardcore:
-            return "_hardcore_ironman"
-        if ironman:
-            return "_ironman"
-        return ""
+    _session: requests.Session | None = field(default=None, init=False, repr=False)
+
+    def _ensure_session(self) -> requests.Session:
+        """Internal: create the pooled session on first use."""
+        if self._session is None:
+            # Imported lazily so `import osrs_info` stays cheap.
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            retries = Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+            )
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retries),
+            )
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Close the underlying HTTP session, if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _mode_suffix(self, **modes: bool) -> str:
+        """Convert mode flags into the hiscores endpoint suffix."""
+        return mode_suffix(**modes)
 
     def fetch_index_lite_json(self, username: str, **modes: Any) -> dict[str, Any]:
         """
@@ -92,8 +139,99 @@ class HiscoresClient:
         mode = self._mode_suffix(**modes)
         url = f"{self.base_url}{mode}/index_lite.json"
         try:
-            r = requests.get(url, params={"player": username}, timeout=self.timeout)
+            session = self._ensure_session()
+            r = session.get(url, params={"player": username}, timeout=self.timeout)
+            r.raise_for_status()
+            return r.json() if orjson is None else orjson.loads(r.content)
+        except Exception as e:
+            raise FetchError(f"Failed to fetch hiscores for '{username}': {e}") from e
+
+
+@dataclass(slots=True)
+class AsyncHiscoresClient:
+    """
+    Async variant of `HiscoresClient` built on `httpx.AsyncClient`.
+
+    Parameters
+    ----------
+    base_url:
+        Root URL for hiscores. Defaults to Old School RuneScape hiscores.
+    timeout:
+        Request timeout in seconds.
+    max_connections:
+        Upper bound on concurrent connections in the pool.
+
+    Notes
+    -----
+    Requires the `httpx` package:
+        pip install "osrs_info[async]"
+
+    The underlying `httpx.AsyncClient` is created lazily on the first fetch
+    and shared by all concurrent lookups. Call `aclose()` (or use
+    `async with`) to release it.
+    """
+
+    base_url: str = DEFAULT_HISCORES_BASE_URL
+    timeout: int = DEFAULT_TIMEOUT
+    max_connections: int = 20
+
+    _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """Internal: create the pooled httpx client on first use."""
+        if self._client is None:
+            try:
+                import httpx  # type: ignore
+            except ImportError as e:
+                raise ImportError(
+                    "Async hiscores requires `httpx`. Install with: "
+                    'pip install "osrs_info[async]"'
+                ) from e
+
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=max(1, self.max_connections // 2),
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncHiscoresClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def fetch_index_lite_json(
+        self, username: str, **modes: Any
+    ) -> dict[str, Any]:
+        """
+        Fetch `/index_lite.json` for a player and return parsed JSON.
+
+        Parameters
+        ----------
+        username:
+            RuneScape display name.
+        **modes:
+            Mode flags forwarded to `mode_suffix`.
+
+        Raises
+        ------
+        FetchError
+            If the request fails or returns invalid JSON.
+        """
+        client = self._ensure_client()
+        url = f"{self.base_url}{mode_suffix(**modes)}/index_lite.json"
+        try:
+            r = await client.get(url, params={"player": username})
             r.raise_for_status()
-            return r.json()
+            return r.json() if orjson is None else orjson.loads(r.content)
         except Exception as e:
             raise FetchError(f"Failed to fetch hiscores for '{username}': {e}") from e
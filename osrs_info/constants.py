@@ -9,6 +9,11 @@ DEFAULT_HISCORES_BASE_URL = "https://secure.runescape.com/m=hiscore_oldschool"
 DEFAULT_ITEMS_BASE_URL = "https://prices.runescape.wiki/api/v1/osrs"
 DEFAULT_TIMEOUT = 10
 
+# Cache lifetimes (seconds) for the Wiki prices API.
+# /latest updates roughly every minute; /mapping only changes on game updates.
+DEFAULT_LATEST_TTL = 60
+DEFAULT_MAPPING_TTL = 3600
+
 # Stable non-boss activities in the hiscores JSON.
 # These are not meant to be fallback order lists—only classification hints.
 NON_BOSS_ACTIVITY_KEYS = {
@@ -8,6 +8,7 @@ sub-clients for hiscores and item prices.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Any
 
 from .client import HiscoresClient
 from .hiscores_api import HiscoresAPI
@@ -23,23 +24,44 @@ class Decoder:
     ----------
     hiscores_client:
         Low-level HTTP client for the official OSRS hiscores endpoint.
+        Created on first access to `.hiscores` unless passed in.
     items_client:
         Client for OSRS Wiki item mapping and prices.
+        Created on first access to `.items` unless passed in.
 
     Notes
     -----
-    After initialization, a high-level HiscoresAPI wrapper is available
-    as `.hiscores`, and the items client is available as `.items`.
+    A high-level HiscoresAPI wrapper is available as `.hiscores`, and the
+    items client is available as `.items`. Each is built lazily, so scripts
+    that only use one API never construct the other.
+
+    Decoder can be used as a context manager to close both clients'
+    HTTP sessions on exit::
+
+        with Decoder() as api:
+            hs = api.hiscores.get("Zezima")
     """
 
-    hiscores_client: HiscoresClient = field(default_factory=HiscoresClient)
-    items_client: ItemsClient = field(default_factory=ItemsClient)
+    hiscores_client: HiscoresClient | None = None
+    items_client: ItemsClient | None = None
 
-    hiscores: HiscoresAPI = field(init=False)
+    _hiscores: HiscoresAPI | None = field(default=None, init=False, repr=False)
 
-    def __post_init__(self) -> None:
-        """Initialize convenience APIs that depend on sub-clients."""
-        self.hiscores = HiscoresAPI(self.hiscores_client)
+    @property
+    def hiscores(self) -> HiscoresAPI:
+        """
+        Access the high-level hiscores API.
+
+        Returns
+        -------
+        HiscoresAPI
+            Wrapper around the (lazily created) hiscores client.
+        """
+        if self._hiscores is None:
+            if self.hiscores_client is None:
+                self.hiscores_client = HiscoresClient()
+            self._hiscores = HiscoresAPI(self.hiscores_client)
+        return self._hiscores
 
     @property
     def items(self) -> ItemsClient:
@@ -49,6 +71,21 @@ class Decoder:
         Returns
         -------
         ItemsClient
-            The configured items client instance.
+            The configured (or lazily created) items client instance.
         """
+        if self.items_client is None:
+            self.items_client = ItemsClient()
         return self.items_client
+
+    def close(self) -> None:
+        """Close HTTP sessions held by any sub-clients that were created."""
+        if self.hiscores_client is not None:
+            self.hiscores_client.close()
+        if self.items_client is not None:
+            self.items_client.close()
+
+    def __enter__(self) -> "Decoder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
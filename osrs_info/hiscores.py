@@ -11,17 +11,43 @@ explicit buckets with stable iteration order.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Iterator
 
 from .client import HiscoresClient
 from .constants import NON_BOSS_ACTIVITY_KEYS, PVP_ACTIVITY_KEYS
 
+# Drop apostrophes and turn other punctuation into word separators.
+_NORM_TRANS = str.maketrans(
+    {"'": None, "-": " ", ":": " ", "(": " ", ")": " ", ",": " "}
+)
 
+# Known activity keys resolved with one dict probe; anything else falls back
+# to the prefix/suffix rules in `Hiscores._parse_activities`.
+_CATEGORY_BY_KEY = {
+    **{k: "pvp" for k in PVP_ACTIVITY_KEYS},
+    **{k: "activity" for k in NON_BOSS_ACTIVITY_KEYS},
+}
+
+# Row field extractors, in SkillEntry / ActivityEntry positional order.
+_SKILL_FIELDS = itemgetter("id", "name", "rank", "level", "xp")
+_ACTIVITY_FIELDS = itemgetter("id", "name", "rank", "score")
+
+# Unknown keys with these suffixes are misc activities rather than bosses.
+_ACTIVITY_SUFFIXES = ("_points", "_rank")
+
+
+@lru_cache(maxsize=1024)
 def normalize_name(name: str) -> str:
     """
     Convert API display names into stable snake_case keys.
 
+    Results are memoized, since the same API names and user keys are
+    normalized on every parse and lookup.
+
     Parameters
     ----------
     name:
@@ -32,11 +58,56 @@ def normalize_name(name: str) -> str:
     str
         A normalized key suitable for dictionary lookups.
     """
-    s = name.strip().lower()
-    s = s.replace("'", "")
-    for ch in ("-", ":", "(", ")", ","):
-        s = s.replace(ch, " ")
-    return "_".join(s.split())
+    return "_".join(name.translate(_NORM_TRANS).lower().split())
+
+
+class _Entry(Mapping):
+    """
+    Read-only mapping view shared by the slotted hiscores entries.
+
+    Entries behave like the dicts they replace (`in`, iteration, `items()`,
+    equality with a dict). `json` only serializes real dicts, so use
+    `to_dict()` when dumping.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the entry as a plain dict."""
+        return {k: getattr(self, k) for k in self.__slots__}
+
+
+# eq=False keeps Mapping's dict-compatible __eq__.
+@dataclass(slots=True, eq=False)
+class SkillEntry(_Entry):
+    """A single skill row. Supports `entry["xp"]` as well as `entry.xp`."""
+
+    id: int
+    name: str
+    rank: int
+    level: int
+    xp: int
+
+
+@dataclass(slots=True, eq=False)
+class ActivityEntry(_Entry):
+    """A single clue, PvP, activity, or boss row. Supports `entry["score"]`."""
+
+    id: int
+    name: str
+    rank: int
+    score: int
 
 
 @dataclass(slots=True)
@@ -49,16 +120,18 @@ class Hiscores:
     username:
         RuneScape display name.
     client:
-        Low-level HTTP client used to fetch hiscores JSON.
+        Low-level HTTP client used to fetch hiscores JSON. If omitted, a
+        default HiscoresClient is created on the first `fetch()`.
 
     Notes
     -----
     Call `fetch()` to retrieve raw JSON and `parse()` to populate buckets.
-    High-level users can instead use `HiscoresAPI.get()`.
+    High-level users can instead use `HiscoresAPI.get()`. JSON fetched
+    elsewhere can be loaded with `Hiscores.from_json()`.
     """
 
     username: str
-    client: HiscoresClient = field(default_factory=HiscoresClient)
+    client: HiscoresClient | None = None
 
     raw_json: dict[str, Any] | None = None
     fetched: bool = False
@@ -72,15 +145,42 @@ class Hiscores:
     boss_order: list[str] = field(default_factory=list)
 
     # Parsed data buckets.
-    skills: dict[str, dict[str, Any]] = field(default_factory=dict)
-    clues: dict[str, dict[str, Any]] = field(default_factory=dict)
-    pvp: dict[str, dict[str, Any]] = field(default_factory=dict)
-    activities: dict[str, dict[str, Any]] = field(default_factory=dict)
-    bosses: dict[str, dict[str, Any]] = field(default_factory=dict)
+    skills: dict[str, SkillEntry] = field(default_factory=dict)
+    clues: dict[str, ActivityEntry] = field(default_factory=dict)
+    pvp: dict[str, ActivityEntry] = field(default_factory=dict)
+    activities: dict[str, ActivityEntry] = field(default_factory=dict)
+    bosses: dict[str, ActivityEntry] = field(default_factory=dict)
 
     # ---------------------------
     # Fetch / parse
     # ---------------------------
+    @classmethod
+    def from_json(
+        cls,
+        username: str,
+        raw_json: dict[str, Any],
+        client: HiscoresClient | None = None,
+    ) -> "Hiscores":
+        """
+        Build a parsed Hiscores from already-fetched `index_lite.json` data.
+
+        Parameters
+        ----------
+        username:
+            RuneScape display name.
+        raw_json:
+            Parsed JSON response from the hiscores API.
+        client:
+            Optional client for later `fetch()` calls.
+
+        Returns
+        -------
+        Hiscores
+            A parsed Hiscores instance.
+        """
+        hs = cls(username=username, client=client, raw_json=raw_json, fetched=True)
+        return hs.parse()
+
     def fetch(self, **modes: Any) -> "Hiscores":
         """
         Fetch raw JSON from the hiscores endpoint.
@@ -100,6 +200,8 @@ class Hiscores:
         FetchError
             If the hiscores endpoint cannot be fetched.
         """
+        if self.client is None:
+            self.client = HiscoresClient()
         self.raw_json = self.client.fetch_index_lite_json(self.username, **modes)
         self.fetched = True
         self.parsed = False
@@ -118,6 +220,8 @@ class Hiscores:
         ------
         ValueError
             If called before fetch() or raw_json is empty.
+        KeyError
+            If a skill or activity row is missing one of its standard fields.
         """
         if not self.raw_json:
             raise ValueError("No raw JSON to parse. Call fetch() first.")
@@ -131,18 +235,19 @@ class Hiscores:
     def _parse_skills(self, skills: list[dict[str, Any]]) -> None:
         """Internal: parse the skills list into a dict, preserving order."""
         self.skills.clear()
-        self.skill_order = []
+        self.skill_order.clear()
+
+        # Bind hot globals/attributes to locals for the loop.
+        norm = normalize_name
+        fields = _SKILL_FIELDS
+        order_append = self.skill_order.append
+        skills_out = self.skills
 
         for row in skills:
-            key = normalize_name(row["name"])
-            self.skill_order.append(key)
-            self.skills[key] = {
-                "id": row.get("id"),
-                "name": row.get("name"),
-                "rank": row.get("rank"),
-                "level": row.get("level"),
-                "xp": row.get("xp"),
-            }
+            values = fields(row)
+            key = norm(values[1])
+            order_append(key)
+            skills_out[key] = SkillEntry(*values)
 
     def _parse_activities(self, acts: list[dict[str, Any]]) -> None:
         """
@@ -153,43 +258,48 @@ class Hiscores:
         self.activities.clear()
         self.bosses.clear()
 
-        self.clue_order = []
-        self.pvp_order = []
-        self.activity_order = []
-        self.boss_order = []
+        self.clue_order.clear()
+        self.pvp_order.clear()
+        self.activity_order.clear()
+        self.boss_order.clear()
+
+        # Bind hot globals/attributes to locals for the loop.
+        norm = normalize_name
+        fields = _ACTIVITY_FIELDS
+        entry = ActivityEntry
+        category_by_key = _CATEGORY_BY_KEY.get
+        activity_suffixes = _ACTIVITY_SUFFIXES
+        targets = {
+            "clue": (self.clue_order.append, self.clues),
+            "pvp": (self.pvp_order.append, self.pvp),
+            "activity": (self.activity_order.append, self.activities),
+            "boss": (self.boss_order.append, self.bosses),
+        }
 
         for row in acts:
-            key = normalize_name(row["name"])
-            data = {
-                "id": row.get("id"),
-                "name": row.get("name"),
-                "rank": row.get("rank"),
-                "score": row.get("score"),
-            }
-
-            if key.startswith("clue_scrolls_"):
-                self.clue_order.append(key)
-                self.clues[key] = data
-            elif key in PVP_ACTIVITY_KEYS:
-                self.pvp_order.append(key)
-                self.pvp[key] = data
-            elif (
-                key in NON_BOSS_ACTIVITY_KEYS
-                or key.endswith("_points")
-                or key.endswith("_rank")
-            ):
-                self.activity_order.append(key)
-                self.activities[key] = data
-            else:
-                self.boss_order.append(key)
-                self.bosses[key] = data
+            values = fields(row)
+            key = norm(values[1])
+            data = entry(*values)
+
+            category = category_by_key(key)
+            if category is None:
+                if key.startswith("clue_scrolls_"):
+                    category = "clue"
+                elif key.endswith(activity_suffixes):
+                    category = "activity"
+                else:
+                    category = "boss"
+
+            append, bucket = targets[category]
+            append(key)
+            bucket[key] = data
 
     # ---------------------------
     # Generic access helpers
     # ---------------------------
     def _get_bucket(
         self,
-        bucket: dict[str, dict[str, Any]],
+        bucket: dict[str, Any],
         key: str,
         field: str | None,
         default: Any,
@@ -211,19 +321,18 @@ class Hiscores:
         Returns
         -------
         Any
-            The full entry dict or a single field.
+            The full entry or a single field.
 
         Raises
         ------
         KeyError
             If key is unknown and default is None.
         """
-        k = normalize_name(key)
-        if k not in bucket:
+        entry = bucket.get(normalize_name(key))
+        if entry is None:
             if default is not None:
                 return default
             raise KeyError(f"Unknown key '{key}'")
-        entry = bucket[k]
         return entry if field is None else entry.get(field, default)
 
     # Skills
@@ -238,7 +347,7 @@ class Hiscores:
         """
         return self._get_bucket(self.skills, key, field, default)
 
-    def skills_iter(self) -> Iterator[tuple[str, dict[str, Any]]]:
+    def skills_iter(self) -> Iterator[tuple[str, SkillEntry]]:
         """Iterate over skills in API order."""
         for k in self.skill_order:
             yield k, self.skills[k]
@@ -248,7 +357,7 @@ class Hiscores:
         """Retrieve a clue scroll entry or field."""
         return self._get_bucket(self.clues, key, field, default)
 
-    def clues_iter(self) -> Iterator[tuple[str, dict[str, Any]]]:
+    def clues_iter(self) -> Iterator[tuple[str, ActivityEntry]]:
         """Iterate over clue scrolls in API order."""
         for k in self.clue_order:
             yield k, self.clues[k]
@@ -260,7 +369,7 @@ class Hiscores:
         """Retrieve a PvP activity entry or field."""
         return self._get_bucket(self.pvp, key, field, default)
 
-    def pvp_iter(self) -> Iterator[tuple[str, dict[str, Any]]]:
+    def pvp_iter(self) -> Iterator[tuple[str, ActivityEntry]]:
         """Iterate over PvP activities in API order."""
         for k in self.pvp_order:
             yield k, self.pvp[k]
@@ -270,7 +379,7 @@ class Hiscores:
         """Retrieve a non-boss activity entry or field."""
         return self._get_bucket(self.activities, key, field, default)
 
-    def activities_iter(self) -> Iterator[tuple[str, dict[str, Any]]]:
+    def activities_iter(self) -> Iterator[tuple[str, ActivityEntry]]:
         """Iterate over misc activities in API order."""
         for k in self.activity_order:
             yield k, self.activities[k]
@@ -280,7 +389,7 @@ class Hiscores:
         """Retrieve a boss entry or field."""
         return self._get_bucket(self.bosses, key, field, default)
 
-    def bosses_iter(self) -> Iterator[tuple[str, dict[str, Any]]]:
+    def bosses_iter(self) -> Iterator[tuple[str, ActivityEntry]]:
         """Iterate over bosses in API order."""
         for k in self.boss_order:
             yield k, self.bosses[k]
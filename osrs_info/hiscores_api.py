@@ -7,10 +7,11 @@ need to manually instantiate Hiscores and call fetch/parse themselves.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
-from .client import HiscoresClient
+from .client import AsyncHiscoresClient, HiscoresClient
 from .hiscores import Hiscores
 
 
@@ -60,3 +61,109 @@ class HiscoresAPI:
         if parse:
             hs.parse()
         return hs
+
+    def refresh(self, hs: Hiscores, **modes: Any) -> Hiscores:
+        """
+        Re-fetch and re-parse an existing Hiscores object in place.
+
+        Useful when polling the same player: the existing buckets and
+        order lists are cleared and refilled rather than reallocated.
+        Instances without a client (e.g. from `Hiscores.from_json()`)
+        adopt this API's shared client.
+
+        Parameters
+        ----------
+        hs:
+            A Hiscores instance, typically returned by `get()`.
+        **modes:
+            Mode flags (ironman, hardcore, etc.).
+
+        Returns
+        -------
+        Hiscores
+            The same instance, refreshed.
+        """
+        if hs.client is None:
+            hs.client = self.client
+        return hs.fetch(**modes).parse()
+
+
+@dataclass(slots=True)
+class AsyncHiscoresAPI:
+    """
+    Async counterpart of `HiscoresAPI` for looking up many players at once.
+
+    Parameters
+    ----------
+    client:
+        Shared AsyncHiscoresClient; all lookups use its connection pool.
+    """
+
+    client: AsyncHiscoresClient
+
+    async def get(self, username: str, **modes: Any) -> Hiscores:
+        """
+        Fetch and parse hiscores for a single player.
+
+        Parameters
+        ----------
+        username:
+            RuneScape display name.
+        **modes:
+            Mode flags (ironman, hardcore, etc.).
+
+        Returns
+        -------
+        Hiscores
+            A parsed Hiscores instance.
+        """
+        raw = await self.client.fetch_index_lite_json(username, **modes)
+        return Hiscores.from_json(username, raw)
+
+    async def get_many(
+        self,
+        usernames: list[str],
+        *,
+        return_exceptions: bool = False,
+        **modes: Any,
+    ) -> list[Hiscores | BaseException]:
+        """
+        Fetch and parse hiscores for several players concurrently.
+
+        At most `client.max_connections` lookups are in flight at once, so
+        large batches queue here instead of timing out waiting for a
+        pooled connection.
+
+        Parameters
+        ----------
+        usernames:
+            RuneScape display names.
+        return_exceptions:
+            If True, a failed lookup yields its exception in that player's
+            slot instead of failing the whole batch.
+        **modes:
+            Mode flags applied to every lookup.
+
+        Returns
+        -------
+        list[Hiscores | BaseException]
+            Parsed Hiscores instances (or exceptions, with
+            `return_exceptions=True`), in the same order as `usernames`.
+
+        Raises
+        ------
+        FetchError
+            If any lookup fails and `return_exceptions` is False.
+        """
+        limit = asyncio.Semaphore(self.client.max_connections)
+
+        async def get_one(username: str) -> Hiscores:
+            async with limit:
+                return await self.get(username, **modes)
+
+        return list(
+            await asyncio.gather(
+                *(get_one(u) for u in usernames),
+                return_exceptions=return_exceptions,
+            )
+        )
@@ -2,8 +2,8 @@
 OSRS item mapping and price client.
 
 Uses the OSRS Wiki prices API:
-- /mapping provides item metadata (cached after first call)
-- /latest provides realtime high/low price snapshots
+- /mapping provides item metadata (cached for an hour by default)
+- /latest provides realtime high/low price snapshots (cached for a minute)
 
 This client supports:
 - exact lookup (by id or exact name)
@@ -20,12 +20,26 @@ from search results and from lookup().
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
-from typing import Any
-
-import requests
-
-from .constants import DEFAULT_ITEMS_BASE_URL, DEFAULT_TIMEOUT
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional speedup
+    orjson = None
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+from .constants import (
+    DEFAULT_ITEMS_BASE_URL,
+    DEFAULT_LATEST_TTL,
+    DEFAULT_MAPPING_TTL,
+    DEFAULT_TIMEOUT,
+)
 from .exceptions import FetchError
 
 
@@ -42,12 +56,23 @@ class ItemsClient:
         Requests timeout in seconds.
     user_agent:
         User-Agent header sent to the Wiki API.
+    latest_ttl_seconds:
+        How long a cached `/latest` snapshot is reused before re-downloading.
+    mapping_ttl_seconds:
+        How long the cached `/mapping` list is reused before re-downloading.
+    http2:
+        If True, talk to the Wiki API over HTTP/2 using `httpx` instead of
+        `requests`. Requires `pip install "osrs_info[http2]"`.
 
     Notes
     -----
-    - Mapping results are cached after the first request.
-      Use `mapping(refresh=True)` to force a reload.
+    - Mapping and latest results are cached until their TTL expires.
+      Use `mapping(refresh=True)` / `latest_index(refresh=True)` to force
+      a reload. If a TTL-triggered reload fails, the cached data keeps
+      being served and the reload is retried after another TTL.
     - Tradeable filtering is done by checking membership in `/latest`.
+    - HTTP requests share one lazily created `requests.Session`
+      (or `httpx.Client` when `http2=True`). Call `close()` to release it.
     - Fuzzy search requires the `rapidfuzz` package:
           pip install rapidfuzz
     """
@@ -59,94 +84,223 @@ class ItemsClient:
     _mapping_cache: list[dict[str, Any]] | None = field(
         default=None, init=False, repr=False
     )
-    _names_cache: list[str] | None = field(default=None, init=False, repr=False)
+    _mapping_cached_at: float = field(default=0.0, init=False, repr=False)
+    # Item ids as strings, aligned to `_mapping_cache`, for `/latest` probes.
+    _item_id_strs: list[str] = field(default_factory=list, init=False, repr=False)
+    # Full (unfiltered) mapping keyed by item id.
+    _mapping_by_id: dict[int, dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     # Cache of `/latest["data"]` dict (keys are item ids as strings).
     _latest_cache: dict[str, Any] | None = field(
         default=None, init=False, repr=False
     )
+    _latest_cached_at: float = field(default=0.0, init=False, repr=False)
+
+    # Tradeable subset of the mapping plus its name index, rebuilt together
+    # whenever the mapping or latest cache is refreshed.
+    _tradeable_cache: list[dict[str, Any]] | None = field(
+        default=None, init=False, repr=False
+    )
+    _name_index: dict[str, dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Lowercased names aligned to the tradeable list, and tradeable indexes
+    # pre-sorted by that name so search() only has to filter.
+    _lower_names: list[str] = field(default_factory=list, init=False, repr=False)
+    _search_order: list[int] = field(default_factory=list, init=False, repr=False)
 
     # Optional alias map for OSRS slang/short-hands.
     aliases: dict[str, str] = field(default_factory=dict)
 
+    latest_ttl_seconds: float = DEFAULT_LATEST_TTL
+    mapping_ttl_seconds: float = DEFAULT_MAPPING_TTL
+    http2: bool = False
+
+    _session: requests.Session | httpx.Client | None = field(
+        default=None, init=False, repr=False
+    )
+
     # ---------------------------
     # Internal HTTP
     # ---------------------------
+    def _ensure_session(self) -> requests.Session | httpx.Client:
+        """Internal: create the pooled session on first use."""
+        if self._session is None:
+            if self.http2:
+                self._session = self._new_http2_client()
+            else:
+                self._session = self._new_requests_session()
+        return self._session
+
+    def _new_requests_session(self) -> requests.Session:
+        """Internal: build a keep-alive `requests.Session`."""
+        # Imported lazily so `import osrs_info` stays cheap.
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers.update({"User-Agent": self.user_agent})
+        session.mount("https://", HTTPAdapter(pool_maxsize=10))
+        return session
+
+    def _new_http2_client(self) -> httpx.Client:
+        """Internal: build an HTTP/2 `httpx.Client`."""
+        try:
+            import httpx  # type: ignore
+
+            return httpx.Client(
+                http2=True,
+                follow_redirects=True,  # match requests' default behaviour
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(max_keepalive_connections=10),
+            )
+        except ImportError as e:
+            raise ImportError(
+                "HTTP/2 requires `httpx[http2]`. Install with: "
+                'pip install "osrs_info[http2]"'
+            ) from e
+
+    def close(self) -> None:
+        """Close the underlying HTTP session, if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def _get(self, path: str) -> Any:
         """Internal GET helper."""
         url = f"{self.base_url}{path}"
+        session = self._ensure_session()
         try:
-            r = requests.get(
-                url,
-                headers={"User-Agent": self.user_agent},
-                timeout=self.timeout,
-            )
+            r = session.get(url, timeout=self.timeout)
             r.raise_for_status()
-            return r.json()
+            return r.json() if orjson is None else orjson.loads(r.content)
         except Exception as e:
             raise FetchError(f"Failed to fetch '{url}': {e}") from e
 
     # ---------------------------
     # Mapping / latest indexing
     # ---------------------------
+    def _load_mapping(self, refresh: bool = False) -> list[dict[str, Any]]:
+        """Internal: return the cached mapping list, downloading if needed."""
+        if (
+            refresh
+            or self._mapping_cache is None
+            or time.monotonic() - self._mapping_cached_at > self.mapping_ttl_seconds
+        ):
+            try:
+                mapping = self._get("/mapping")
+            except FetchError:
+                if refresh or self._mapping_cache is None:
+                    raise
+                # Keep serving the expired mapping; retry after another TTL.
+                self._mapping_cached_at = time.monotonic()
+                return self._mapping_cache
+            self._mapping_cache = mapping
+            self._mapping_cached_at = time.monotonic()
+            self._item_id_strs = [str(it.get("id")) for it in self._mapping_cache]
+            # Built in reverse so the first entry wins on duplicate ids.
+            self._mapping_by_id = {
+                it.get("id"): it for it in reversed(self._mapping_cache)
+            }
+            self._tradeable_cache = None
+        return self._mapping_cache
+
+    def _load_latest(self, refresh: bool = False) -> dict[str, Any]:
+        """Internal: return the cached latest dict, downloading if needed."""
+        if (
+            refresh
+            or self._latest_cache is None
+            or time.monotonic() - self._latest_cached_at > self.latest_ttl_seconds
+        ):
+            try:
+                data = self._get("/latest")
+            except FetchError:
+                if refresh or self._latest_cache is None:
+                    raise
+                # Keep serving the expired snapshot; retry after another TTL.
+                self._latest_cached_at = time.monotonic()
+                return self._latest_cache
+            self._latest_cache = data.get("data", {}) or {}
+            self._latest_cached_at = time.monotonic()
+            self._tradeable_cache = None
+        return self._latest_cache
+
+    def _load_tradeable(self, refresh: bool = False) -> list[dict[str, Any]]:
+        """Internal: return the cached tradeable list, rebuilding if stale."""
+        items = self._load_mapping(refresh=refresh)
+        latest = self._load_latest(refresh=refresh)
+
+        if self._tradeable_cache is None:
+            tradeable: list[dict[str, Any]] = []
+            lower_names: list[str] = []
+            name_index: dict[str, dict[str, Any]] = {}
+            for it, id_str in zip(items, self._item_id_strs):
+                if id_str not in latest:
+                    continue
+                lower = str(it.get("name", "")).lower()
+                tradeable.append(it)
+                lower_names.append(lower)
+                name_index.setdefault(lower, it)
+
+            self._tradeable_cache = tradeable
+            self._lower_names = lower_names
+            self._search_order = sorted(
+                range(len(lower_names)), key=lower_names.__getitem__
+            )
+            self._name_index = name_index
+        return self._tradeable_cache
+
     def mapping(self, refresh: bool = False) -> list[dict[str, Any]]:
         """
         Return the full item mapping list (unfiltered).
 
+        The cached list is returned as-is; copy it before mutating.
+
         Parameters
         ----------
         refresh:
             If True, re-download mapping even if cached.
         """
-        if self._mapping_cache is None or refresh:
-            self._mapping_cache = self._get("/mapping")
-            self._names_cache = [str(it.get("name", "")) for it in self._mapping_cache]
-        return list(self._mapping_cache)
+        return self._load_mapping(refresh=refresh)
 
-    def latest_index(self, refresh: bool = False) -> dict[str, Any]:
+    def latest_index(self, refresh: bool = False) -> Mapping[str, Any]:
         """
-        Return cached `/latest["data"]`.
+        Return a read-only view of cached `/latest["data"]`.
 
         Parameters
         ----------
         refresh:
-            If True, re-download latest even if cached.
+            If True, re-download latest even if cached and not yet stale.
 
         Returns
         -------
-        dict[str, Any]
+        Mapping[str, Any]
             Mapping of item_id (as string) -> {"high":..., "low":...}
         """
-        if self._latest_cache is None or refresh:
-            data = self._get("/latest")
-            self._latest_cache = data.get("data", {}) or {}
-        return dict(self._latest_cache)
+        return MappingProxyType(self._load_latest(refresh=refresh))
 
     def tradeable_mapping(self, refresh: bool = False) -> list[dict[str, Any]]:
         """
         Return only items that have GE price data.
 
+        The filtered list and its name index are cached and only
+        rebuilt when the mapping or latest cache changes. The cached list
+        is returned as-is; copy it before mutating.
+
         Parameters
         ----------
         refresh:
             If True, refresh mapping and latest caches first.
         """
-        items = self.mapping(refresh=refresh)
-        latest = self.latest_index(refresh=refresh)
-        latest_ids = set(latest.keys())
-
-        tradeable = [it for it in items if str(it.get("id")) in latest_ids]
-        return tradeable
-
-    def _names_tradeable(self, refresh: bool = False) -> list[str]:
-        """Internal: names aligned to tradeable_mapping()."""
-        items = self.tradeable_mapping(refresh=refresh)
-        return [str(it.get("name", "")) for it in items]
+        return self._load_tradeable(refresh=refresh)
 
     def _apply_alias(self, query: str) -> str:
-        """Internal: apply alias normalization if an alias exists."""
+        """Internal: return the lowercased query, resolved through aliases."""
         q = query.strip().lower()
-        return self.aliases.get(q, query)
+        alias = self.aliases.get(q)
+        return q if alias is None else alias.strip().lower()
 
     # ---------------------------
     # Lookup / search
@@ -160,22 +314,21 @@ class ItemsClient:
         KeyError
             If item is unknown OR is not tradeable (no GE price).
         """
-        items = self.tradeable_mapping()
-
         if isinstance(item, int):
-            item_id_str = str(item)
-            if item_id_str not in self.latest_index():
+            # Id lookups only need the two raw caches, not the tradeable list.
+            self._load_mapping()
+            if str(item) not in self._load_latest():
                 raise KeyError(f"Item id {item} is not tradeable or has no GE price.")
-            for it in items:
-                if it.get("id") == item:
-                    return it
-            raise KeyError(f"Unknown item id {item}")
+            it = self._mapping_by_id.get(item)
+            if it is None:
+                raise KeyError(f"Unknown item id {item}")
+            return it
 
-        query = self._apply_alias(item).strip().lower()
-        for it in items:
-            if str(it.get("name", "")).lower() == query:
-                return it
-        raise KeyError(f"Unknown or untradeable item name '{item}'")
+        self._load_tradeable()
+        it = self._name_index.get(self._apply_alias(item))
+        if it is None:
+            raise KeyError(f"Unknown or untradeable item name '{item}'")
+        return it
 
     def search(
         self,
@@ -194,13 +347,12 @@ class ItemsClient:
         2) If `fuzzy=True` and substring search returns no hits,
            fall back to RapidFuzz fuzzy matching (still tradeable-only).
         """
-        query = self._apply_alias(query)
-        q = query.strip().lower()
+        q = self._apply_alias(query)
 
-        items = self.tradeable_mapping()
+        items = self._load_tradeable()
+        names = self._lower_names
 
-        hits = [it for it in items if q in str(it.get("name", "")).lower()]
-        hits.sort(key=lambda it: str(it.get("name", "")).lower())
+        hits = [items[i] for i in self._search_order if q in names[i]]
 
         if hits or not fuzzy:
             return hits[:limit] if limit else hits
@@ -225,7 +377,7 @@ class ItemsClient:
         ImportError
             If rapidfuzz is not installed.
         """
-        query = self._apply_alias(query)
+        q = self._apply_alias(query)
 
         try:
             from rapidfuzz import process, fuzz  # type: ignore
@@ -234,15 +386,17 @@ class ItemsClient:
                 "Fuzzy search requires `rapidfuzz`. Install with: pip install rapidfuzz"
             ) from e
 
-        items = self.tradeable_mapping()
-        names = [str(it.get("name", "")) for it in items]
+        items = self._load_tradeable()
 
         scorer_fn = getattr(fuzz, scorer, fuzz.WRatio)
 
+        # Query and cached names are already lowercased, so skip RapidFuzz's
+        # per-choice preprocessing.
         matches = process.extract(
-            query,
-            names,
+            q,
+            self._lower_names,
             scorer=scorer_fn,
+            processor=None,
             limit=limit,
             score_cutoff=score_cutoff,
         )
@@ -255,8 +409,7 @@ class ItemsClient:
         """
         Return latest high/low for a single tradeable item id.
         """
-        latest = self.latest_index()
-        data = latest.get(str(item_id))
+        data = self._load_latest().get(str(item_id))
         if data is None:
             raise KeyError(f"No latest price for id {item_id} (not tradeable?)")
         return data
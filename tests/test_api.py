@@ -7,8 +7,13 @@ We monkeypatch the low-level HTTP call and assert that:
 - Bucket classification (skills/clues/pvp/bosses) works end-to-end
 """
 
-from osrs_info import Decoder
-import osrs_info.client as client_mod
+import asyncio
+import json
+
+import pytest
+import requests
+
+from osrs_info import Decoder, Hiscores
 
 
 class FakeResponse:
@@ -24,6 +29,10 @@ class FakeResponse:
     def json(self):
         return self._payload
 
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
+
 
 def test_hiscores_api_fixture(monkeypatch):
     fake_json = {
@@ -41,13 +50,13 @@ def test_hiscores_api_fixture(monkeypatch):
         ],
     }
 
-    def fake_get(url, params=None, timeout=None, headers=None):
+    def fake_get(self, url, params=None, timeout=None, headers=None):
         # Ensure the right endpoint and query param are used.
         assert url.endswith("/index_lite.json")
         assert params["player"] == "FixtureUser"
         return FakeResponse(fake_json)
 
-    monkeypatch.setattr(client_mod.requests, "get", fake_get)
+    monkeypatch.setattr(requests.Session, "get", fake_get)
 
     api = Decoder()
     hs = api.hiscores.get("FixtureUser")  # fetch + parse by default
@@ -56,3 +65,116 @@ def test_hiscores_api_fixture(monkeypatch):
     assert hs.clue("clue_scrolls_all", "score") == 42
     assert hs.pvp_score("bounty_hunter_hunter") == 3
     assert hs.boss("zulrah", "score") == 55
+
+    skills = hs.skills
+    fake_json["skills"][1]["level"] = 98
+    assert api.hiscores.refresh(hs) is hs
+    assert hs.skills is skills
+    assert hs.skill("attack", "level") == 98
+
+    # Instances built from JSON adopt the API's shared client on refresh.
+    detached = Hiscores.from_json("FixtureUser", fake_json)
+    api.hiscores.refresh(detached)
+    assert detached.client is api.hiscores.client
+
+
+def test_hiscores_client_reuses_session():
+    from osrs_info.client import HiscoresClient
+
+    client = HiscoresClient()
+    first = client._ensure_session()
+    assert client._ensure_session() is first
+
+    client.close()
+    assert client._session is None
+
+
+def test_decoder_context_manager_closes_sessions():
+    with Decoder() as api:
+        assert api.hiscores_client is None and api.items_client is None
+        api.hiscores.client._ensure_session()
+        api.items._ensure_session()
+
+    assert api.hiscores_client._session is None
+    assert api.items_client._session is None
+
+
+def test_async_hiscores_get_many():
+    httpx = pytest.importorskip("httpx")
+    from osrs_info import AsyncHiscoresAPI, AsyncHiscoresClient
+
+    def handler(request):
+        assert request.url.path.endswith("_ironman/index_lite.json")
+        player = request.url.params["player"]
+        return httpx.Response(
+            200,
+            json={
+                "skills": [
+                    {
+                        "id": 1,
+                        "name": "Attack",
+                        "rank": 1,
+                        "level": len(player),
+                        "xp": 0,
+                    }
+                ],
+                "activities": [],
+            },
+        )
+
+    async def run():
+        async with AsyncHiscoresClient() as client:
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            api = AsyncHiscoresAPI(client)
+            return await api.get_many(["Zezima", "Lynx Titan"], ironman=True)
+
+    results = asyncio.run(run())
+
+    assert [hs.username for hs in results] == ["Zezima", "Lynx Titan"]
+    assert [hs.skill("attack", "level") for hs in results] == [6, 10]
+    # No throwaway blocking clients are created for async results.
+    assert all(hs.client is None and hs.fetched and hs.parsed for hs in results)
+
+
+def test_import_does_not_load_requests():
+    import subprocess
+    import sys
+
+    code = "import sys, osrs_info; print('requests' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_async_get_many_caps_concurrency_and_collects_errors():
+    httpx = pytest.importorskip("httpx")
+    from osrs_info import AsyncHiscoresAPI, AsyncHiscoresClient
+    from osrs_info.exceptions import FetchError
+
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if request.url.params["player"] == "missing":
+            return httpx.Response(404, request=request)
+        return httpx.Response(200, json={"skills": [], "activities": []})
+
+    usernames = [f"player{i}" for i in range(9)] + ["missing"]
+
+    async def run():
+        async with AsyncHiscoresClient(max_connections=2) as client:
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            api = AsyncHiscoresAPI(client)
+            return await api.get_many(usernames, return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert peak <= 2
+    assert [hs.username for hs in results[:-1]] == usernames[:-1]
+    assert isinstance(results[-1], FetchError)
@@ -30,3 +30,24 @@ def test_parse_bosses_from_fixture():
     # Non-boss buckets still populated correctly
     assert "clue_scrolls_all" in hs.clues
     assert "bounty_hunter_hunter" in hs.pvp
+
+
+def test_activity_classification_precedence():
+    hs = Hiscores("FixtureUser")
+    hs.raw_json = {
+        "skills": [],
+        "activities": [
+            {"id": 0, "name": "League Points", "rank": -1, "score": 10},
+            {"id": 1, "name": "LMS - Rank", "rank": -1, "score": 4},
+            {"id": 2, "name": "Colosseum Glory", "rank": -1, "score": 7},
+            {"id": 3, "name": "Clue Scrolls (beginner)", "rank": -1, "score": 1},
+            {"id": 4, "name": "Zulrah", "rank": -1, "score": 5},
+        ],
+    }
+    hs.parse()
+
+    # Known PvP keys win over the generic "_rank" suffix rule.
+    assert hs.pvp_order == ["lms_rank"]
+    assert hs.activity_order == ["league_points", "colosseum_glory"]
+    assert hs.clue_order == ["clue_scrolls_beginner"]
+    assert hs.boss_order == ["zulrah"]
@@ -7,6 +7,8 @@ We verify:
 - new skills (e.g., Sailing) are handled automatically
 """
 
+import pytest
+
 from osrs_info.hiscores import Hiscores
 
 
@@ -27,3 +29,39 @@ def test_parse_skills_from_fixture():
     assert hs.skill("attack", "level") == 99
     assert hs.skill("attack")["xp"] == 13034431
     assert "sailing" in hs.skills
+
+
+def test_skill_entries_keep_dict_access():
+    hs = Hiscores("FixtureUser")
+    hs.raw_json = {
+        "skills": [{"id": 1, "name": "Attack", "rank": 2, "level": 99, "xp": 13034431}],
+        "activities": [{"id": 87, "name": "Zulrah", "rank": 100, "score": 55}],
+    }
+    hs.parse()
+
+    attack = hs.skill("attack")
+    assert attack.level == attack["level"] == 99
+    assert attack.get("missing", 0) == 0
+    assert dict(attack) == attack.to_dict() == {
+        "id": 1,
+        "name": "Attack",
+        "rank": 2,
+        "level": 99,
+        "xp": 13034431,
+    }
+    assert "xp" in attack and "score" not in attack
+    assert list(attack) == ["id", "name", "rank", "level", "xp"]
+    assert len(attack) == 5
+    assert ("level", 99) in attack.items()
+    assert attack == {
+        "id": 1,
+        "name": "Attack",
+        "rank": 2,
+        "level": 99,
+        "xp": 13034431,
+    }
+    with pytest.raises(KeyError):
+        attack["missing"]
+
+    assert hs.boss("zulrah")["score"] == 55
+    assert hs.skill("attack", "missing", default=-1) == -1
@@ -8,8 +8,14 @@ Key points:
 - latest()/price() read from /latest
 """
 
+import copy
+import json
+
+import pytest
+import requests
+
+from osrs_info.exceptions import FetchError
 from osrs_info.items import ItemsClient
-import osrs_info.items as items_mod
 
 
 class FakeResponse:
@@ -23,21 +29,26 @@ class FakeResponse:
             raise RuntimeError("bad status")
 
     def json(self):
-        return self._payload
+        # Like a real response, hand out a fresh object on every decode.
+        return copy.deepcopy(self._payload)
+
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
 
 
 def _patch_items_endpoints(monkeypatch, *, mapping_payload, latest_payload):
     """
-    Helper to patch requests.get for both /mapping and /latest endpoints.
+    Helper to patch Session.get for both /mapping and /latest endpoints.
     """
-    def fake_get(url, headers=None, timeout=None):
+    def fake_get(self, url, headers=None, timeout=None):
         if url.endswith("/mapping"):
             return FakeResponse(mapping_payload)
         if url.endswith("/latest"):
             return FakeResponse(latest_payload)
         raise AssertionError(f"Unexpected URL: {url}")
 
-    monkeypatch.setattr(items_mod.requests, "get", fake_get)
+    monkeypatch.setattr(requests.Session, "get", fake_get)
 
 
 def test_items_mapping_and_lookup(monkeypatch):
@@ -122,3 +133,157 @@ def test_items_latest_and_price(monkeypatch):
     bundle = client.price(4151)
     assert bundle["meta"]["name"] == "Abyssal whip"
     assert bundle["price"]["low"] == 2200000
+
+
+def test_items_tradeable_index_rebuilt_on_refresh(monkeypatch):
+    client = ItemsClient()
+
+    fake_mapping = [
+        {"id": 4151, "name": "Abyssal whip"},
+        {"id": 11840, "name": "Dragon boots"},
+    ]
+    latest_payload = {"data": {"4151": {"high": 1, "low": 1}}}
+
+    _patch_items_endpoints(
+        monkeypatch,
+        mapping_payload=fake_mapping,
+        latest_payload=latest_payload,
+    )
+
+    assert client.lookup("abyssal whip")["id"] == 4151
+    with pytest.raises(KeyError):
+        client.lookup(11840)
+
+    latest_payload["data"]["11840"] = {"high": 1, "low": 1}
+    client.tradeable_mapping(refresh=True)
+
+    assert client.lookup(11840)["name"] == "Dragon boots"
+    assert client.lookup("Dragon boots")["id"] == 11840
+
+
+def test_items_aliases_resolve_case_insensitively(monkeypatch):
+    client = ItemsClient(aliases={"whip": "Abyssal Whip"})
+
+    _patch_items_endpoints(
+        monkeypatch,
+        mapping_payload=[{"id": 4151, "name": "Abyssal whip"}],
+        latest_payload={"data": {"4151": {"high": 1, "low": 1}}},
+    )
+
+    assert client.lookup(" WHIP ")["id"] == 4151
+    assert [h["id"] for h in client.search("Whip")] == [4151]
+
+
+def test_items_fuzzy_fallback(monkeypatch):
+    pytest.importorskip("rapidfuzz")
+    client = ItemsClient()
+
+    _patch_items_endpoints(
+        monkeypatch,
+        mapping_payload=[
+            {"id": 4151, "name": "Abyssal whip"},
+            {"id": 11840, "name": "Dragon boots"},
+        ],
+        latest_payload={
+            "data": {"4151": {"high": 1, "low": 1}, "11840": {"high": 1, "low": 1}}
+        },
+    )
+
+    assert client.search("Dragn Boots") == []
+    hits = client.search("Dragn Boots", fuzzy=True)
+    assert hits[0]["id"] == 11840
+
+
+def test_items_latest_index_is_read_only(monkeypatch):
+    client = ItemsClient()
+
+    _patch_items_endpoints(
+        monkeypatch,
+        mapping_payload=[],
+        latest_payload={"data": {"4151": {"high": 1, "low": 1}}},
+    )
+
+    latest = client.latest_index()
+    assert latest["4151"]["high"] == 1
+    with pytest.raises(TypeError):
+        latest["4151"] = {}
+
+
+def test_items_latest_cache_expires_after_ttl(monkeypatch):
+    client = ItemsClient(latest_ttl_seconds=60)
+    calls = []
+
+    def fake_get(self, url, headers=None, timeout=None):
+        calls.append(url.rsplit("/", 1)[-1])
+        return FakeResponse({"data": {"4151": {"high": len(calls), "low": 1}}})
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+    assert client.latest(4151)["high"] == 1
+    assert client.latest(4151)["high"] == 1
+    assert calls == ["latest"]
+
+    # Pretend the snapshot is older than the TTL.
+    client._latest_cached_at -= 61
+    assert client.latest(4151)["high"] == 2
+    assert calls == ["latest", "latest"]
+
+
+def test_items_http2_client(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    client = ItemsClient(http2=True)
+
+    session = client._ensure_session()
+    assert isinstance(session, httpx.Client)
+    assert session.headers["User-Agent"] == "osrs_info"
+    assert session.follow_redirects
+
+    def fake_get(self, url, timeout=None):
+        assert url.endswith("/latest")
+        return httpx.Response(
+            200,
+            json={"data": {"4151": {"high": 5, "low": 4}}},
+            request=httpx.Request("GET", url),
+        )
+
+    monkeypatch.setattr(httpx.Client, "get", fake_get)
+    assert client.latest(4151)["high"] == 5
+
+    client.close()
+    assert client._session is None
+
+
+def test_items_serves_cached_data_when_ttl_reload_fails(monkeypatch):
+    client = ItemsClient()
+    network_up = True
+
+    def fake_get(self, url, headers=None, timeout=None):
+        if not network_up:
+            raise requests.ConnectionError("network down")
+        if url.endswith("/mapping"):
+            return FakeResponse([{"id": 4151, "name": "Abyssal whip"}])
+        return FakeResponse({"data": {"4151": {"high": 1, "low": 1}}})
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+    assert [h["id"] for h in client.search("whip")] == [4151]
+
+    network_up = False
+    client._latest_cached_at -= 61
+    client._mapping_cached_at -= 3601
+
+    assert [h["id"] for h in client.search("whip")] == [4151]
+    assert client.price(4151)["price"]["high"] == 1
+
+    # An explicit refresh still reports the failure.
+    with pytest.raises(FetchError):
+        client.latest_index(refresh=True)
+
+
+def test_items_client_positional_fields_keep_order():
+    aliases = {"whip": "Abyssal whip"}
+    client = ItemsClient("https://example.invalid", 5, "ua", aliases)
+
+    assert client.aliases is aliases
+    assert client.http2 is False